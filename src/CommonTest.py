@@ -1,7 +1,22 @@
+import csv
+import codecs
+import hashlib
+import math
+import mmap
+import json
+import os
+import site
+from pathlib import Path
+from collections import Counter, defaultdict
+from itertools import chain
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from openpyxl.utils import get_column_letter
 import openpyxl
+import xlsxwriter
 import pandas as pd
 from enum import IntEnum, Enum
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 
 class _Column(IntEnum):
     ROW     = 1
@@ -10,6 +25,20 @@ class _Column(IntEnum):
     OPER    = 4
     ACT_VAL = 5
     CHECK   = 6
+    COMMENT = 7
+    ROW_LINK = 8
+    EXP_LINK = 9
+    ACT_LINK = 10
+
+# pd.read_csv default na_values, these fields are read as NaN (empty cells)
+_NA_VALUES = frozenset([
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a",
+    "nan", "null"
+])
+
+# Excel row limit, one row is taken by the Results header
+_MAX_RESULT_ROWS = 1048576 - 1
 
 class _Result(Enum):
     PASS = "PASS"
@@ -41,8 +70,41 @@ class _CellFormat(Enum):
         color="0000FF", 
         underline="single")
 
+def _writeResultsShard(shard: Tuple) -> int:
+    # Runs in a worker process, rows are lists of (value, hyperlink, comment)
+    shard_file, headers, rows = shard
+    workbook = xlsxwriter.Workbook(shard_file, {"constant_memory": True})
+    worksheet = workbook.add_worksheet("Results")
+    header_format = workbook.add_format({
+        "bold": True,
+        "align": "center",
+        "valign": "vcenter",
+        "border": 1
+    })
+    link_format = workbook.add_format({"font_color": "0000FF", "underline": 1})
+
+    for col_num, header in enumerate(headers):
+        worksheet.write(0, col_num, header, header_format)
+    worksheet.freeze_panes(1, 0)
+
+    for row_num, row in enumerate(rows, start=1):
+        for col_num, (value, hyperlink, comment) in enumerate(row):
+            if hyperlink is not None:
+                worksheet.write_url(row_num, col_num, f"external:{hyperlink}", 
+                                    link_format, string="" if value is None else str(value))
+            elif value is not None:
+                worksheet.write(row_num, col_num, value)
+            
+            if comment is not None:
+                worksheet.write_comment(row_num, col_num, comment)
+
+    workbook.close()
+    return len(rows)
+
 class CommonTest:
-    def __init__(self):
+    def __init__(self, compactResults: Optional [bool] = False,
+                 resultsShardRows: Optional [int] = None,
+                 shardFiles: Optional [bool] = False):
         # Workbook / worksheet state
         self.workbook   = None
         self.results_ws = None
@@ -50,6 +112,34 @@ class CommonTest:
         self.currentResultsRow = None
         self.total_rows = []
         self.total_cols = []
+        self.fingerprints = []
+
+        # Probe mode answers lookups from the CSVs until a write needs
+        # the workbook, (csv_files, output_file) while deferred
+        self._pendingTest = None
+
+        # Compact mode keeps comments in a column and writes HYPERLINK()
+        # formulas to link columns, leaving the data cells as plain values
+        self.compactResults = compactResults
+
+        # Results roll over to Results-2, Results-3... after this many rows,
+        # shardFiles writes each one to its own file at endTest
+        if resultsShardRows is not None and resultsShardRows < 1:
+            raise ValueError(f"resultsShardRows must be at least 1, got {resultsShardRows}")
+        self.resultsShardRows = min(resultsShardRows or _MAX_RESULT_ROWS, 
+                                    _MAX_RESULT_ROWS)
+        self.shardFiles = shardFiles
+        self._linkFile  = ""
+
+        # Cross-sheet lookup index, {colName: {value: [(csvSheet, row), ...]}}
+        self._sheetIndex = {}
+
+        # Running PASS/FAIL totals, {group: {key: Counter}}
+        self._resultSummary = {
+            "titleStr": defaultdict(Counter),
+            "operation": defaultdict(Counter),
+            "csvSheet": defaultdict(Counter)
+        }
 
         # Default row/column start (optional)
         self._rowCol    = _Column.ROW
@@ -58,20 +148,34 @@ class CommonTest:
         self._operCol   = _Column.OPER
         self._actValCol = _Column.ACT_VAL
         self._checkCol  = _Column.CHECK
+        self._cmmtCol   = _Column.COMMENT
+        self._linkCols  = {
+            _Column.ROW: _Column.ROW_LINK,
+            _Column.EXP_VAL: _Column.EXP_LINK,
+            _Column.ACT_VAL: _Column.ACT_LINK
+        }
 
         # Default result values
         self._passVal = _Result.PASS
         self._failVal = _Result.FAIL
 
         # _Operations dictionary for quick lookup
-        self._basicOperations = {op.name: op.value for op in _Operation}
+        # SEQ/NEQ are Enum aliases of EQ/NE, iterating _Operation skips them
+        self._basicOperations = {name: op.value for name, op in _Operation.__members__.items()}
 
         # Color Formats
-        self._redFont = _CellFormat.REDFONT
-        self._orangeFill = _CellFormat.ORANGEFILL
-        self._hyperLinkFont = _CellFormat.HYPERLINK   
-
-    def initializeTest(self, csv_files: List, output_file: str) -> None:
+        self._redFont = _CellFormat.REDFONT.value
+        self._orangeFill = _CellFormat.ORANGEFILL.value
+        self._hyperLinkFont = _CellFormat.HYPERLINK.value
+
+    def initializeTest(self, csv_files: List, output_file: str, 
+                       probe: Optional [bool] = False) -> None:
+        if probe:
+            self._pendingTest = (list(csv_files), output_file)
+            return
+        
+        # Shard files live outside the data workbook, so links name it
+        self._linkFile = Path(output_file).name if self.shardFiles else ""
         with pd.ExcelWriter(output_file, engine="xlsxwriter") as writer:
             self.workbook = writer.book
             header_format = self.workbook.add_format({'bold': True})
@@ -94,12 +198,169 @@ class CommonTest:
                 
                 self.total_rows.append(rows)
                 self.total_cols.append(cols)
+                self.fingerprints.append(self._fingerprintRows(
+                    chain([df.columns.values], df.itertuples(index=False))))
         
             self._createResultsFile()
         self._openResultsWorkbook(output_file)
 
     def endTest(self, output_file: str) -> None:
-        self.workbook.save(output_file) 
+        self._materializeWorkbook()
+        self._writeSummarySheet()
+        if self.shardFiles:
+            self._saveResultShards(output_file)
+        else:
+            self.workbook.save(output_file) 
+
+        with open(self._summaryFile(output_file), "w") as summary_file:
+            json.dump(self.getResultSummary(), summary_file, indent=2)
+
+    def _saveResultShards(self, output_file: str) -> None:
+        path = Path(output_file)
+        shards = []
+        for index, results_ws in enumerate(self._resultsSheets(), start=1):
+            shard_file = path.with_name(f"{path.stem}_Results-{index}{path.suffix}")
+            shards.append((str(shard_file), self._resultsHeaders(), 
+                           self._extractResultRows(results_ws)))
+
+        # This module may be loaded from a file path, so spawn/forkserver
+        # workers get its directory on sys.path before unpickling the task
+        max_workers = max(1, min(len(shards), os.cpu_count() or 1))
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers,
+                                     initializer=site.addsitedir,
+                                     initargs=(str(Path(__file__).resolve().parent),)) as executor:
+                row_counts = list(executor.map(_writeResultsShard, shards))
+        except (BrokenProcessPool, OSError):
+            row_counts = [_writeResultsShard(shard) for shard in shards]
+
+        # Results only leave the data workbook once every shard is on disk
+        for results_ws in self._resultsSheets():
+            del self.workbook[results_ws.title]
+        self.workbook.save(output_file)
+
+        index_file = path.with_name(f"{path.stem}_Results{path.suffix}")
+        self._writeResultsIndex(index_file=str(index_file), 
+                                shard_files=[shard[0] for shard in shards], 
+                                row_counts=row_counts)
+
+    def _extractResultRows(self, results_ws) -> List:
+        rows = []
+        for row in results_ws.iter_rows(min_row=2):
+            rows.append([(cell.value,
+                          cell.hyperlink.target if cell.hyperlink else None,
+                          cell.comment.text if cell.comment else None) 
+                         for cell in row])
+        return rows
+
+    def _writeResultsIndex(self, index_file: str, shard_files: List, 
+                           row_counts: List) -> None:
+        workbook = xlsxwriter.Workbook(index_file)
+        worksheet = workbook.add_worksheet("Index")
+        header_format = workbook.add_format({"bold": True, "border": 1})
+        link_format = workbook.add_format({"font_color": "0000FF", "underline": 1})
+
+        for col_num, header in enumerate(["Shard", "Rows", "File"]):
+            worksheet.write(0, col_num, header, header_format)
+
+        for row_num, (shard_file, rows) in enumerate(zip(shard_files, row_counts), start=1):
+            shard_name = Path(shard_file).name
+            worksheet.write(row_num, 0, row_num)
+            worksheet.write(row_num, 1, rows)
+            worksheet.write_url(row_num, 2, f"external:{shard_name}", 
+                                link_format, string=shard_name)
+
+        worksheet.write(len(shard_files) + 1, 0, "Total", header_format)
+        worksheet.write(len(shard_files) + 1, 1, sum(row_counts), header_format)
+        worksheet.set_column(2, 2, max([len(Path(f).name) for f in shard_files] + [10]) + 2)
+        workbook.close()
+
+    def getResultSummary(self) -> Dict:
+        # Every result is counted once per group, so any group gives the total
+        total = sum(self._resultSummary["titleStr"].values(), Counter())
+        summary = {"total": self._countTotals(total)}
+        for group, counters in self._resultSummary.items():
+            summary[group] = {str(key): self._countTotals(counter) 
+                              for key, counter in counters.items()}
+
+        return summary
+
+    def _countTotals(self, counter: Counter) -> Dict:
+        passCount = counter[self._passVal.value]
+        failCount = counter[self._failVal.value]
+        return {
+            self._passVal.value: passCount,
+            self._failVal.value: failCount,
+            "Total": passCount + failCount
+        }
+
+    def _summaryFile(self, output_file: str) -> str:
+        return str(Path(output_file).with_suffix(".summary.json"))
+
+    def _writeSummarySheet(self) -> None:
+        # Static values only, no COUNTIF over the Results sheet
+        if "Summary" in self.workbook.sheetnames:
+            del self.workbook["Summary"]
+        
+        summary_ws = self.workbook.create_sheet("Summary")
+        headers = ["Group", "Name", self._passVal.value, 
+                   self._failVal.value, "Total"]
+        summary_ws.append(headers)
+        for cell in summary_ws[1]:
+            cell.font = openpyxl.styles.Font(bold=True)
+
+        summary = self.getResultSummary()
+        summary_ws.append(["Total", None, *summary["total"].values()])
+        for group in self._resultSummary:
+            for key, counts in summary[group].items():
+                summary_ws.append([group, key, *counts.values()])
+
+        summary_ws.freeze_panes = "A2"
+
+    def _recordResult(self, titleStr: str, operation: str, 
+                      csvSheet: int, result: Optional [str]) -> None:
+        if result is None:
+            return
+        
+        self._resultSummary["titleStr"][titleStr][result] += 1
+        self._resultSummary["operation"][operation][result] += 1
+        self._resultSummary["csvSheet"][csvSheet][result] += 1
+
+    def verifyImport(self, output_file: str) -> bool:
+        # Single streaming pass over the saved workbook, compared against the
+        # fingerprints taken while the CSVs were ingested
+        self._materializeWorkbook()
+        workbook = openpyxl.load_workbook(output_file, read_only=True)
+        try:
+            for index, expected in enumerate(self.fingerprints):
+                sheet_name = f"AnalyzedData-{index+1}"
+                if sheet_name not in workbook.sheetnames:
+                    return False
+
+                iterator = workbook[sheet_name].iter_rows(values_only=True)
+                if self._fingerprintRows(iterator) != expected:
+                    return False
+        finally:
+            workbook.close()
+
+        return True
+
+    def _fingerprintRows(self, iterator) -> Tuple[int, int, str]:
+        rows, cols = -1, 0
+        digest = hashlib.sha1()
+        for row in iterator:
+            # Empty CSV fields come back as NaN from pandas and None from openpyxl
+            values = ["" if value is None or value != value else str(value) 
+                      for value in row]
+            while values and values[-1] == "":
+                values.pop()
+
+            digest.update("\x1f".join(values).encode("utf-8"))
+            digest.update(b"\x1e")
+            rows, cols = rows + 1, max(cols, len(values))
+
+        # Header row is not counted, matching total_rows
+        return max(rows, 0), cols, digest.hexdigest()
 
     def _createResultsFile(self) -> None:
         self.results_ws = self.workbook.add_worksheet("Results")
@@ -113,26 +374,131 @@ class CommonTest:
             "border": 1
         })
 
-        headers = ["Row Index","Name","Actual Value",
-                    "Operation","Expected Value"]
-
-        for col_num, header in enumerate(headers):
+        for col_num, header in enumerate(self._resultsHeaders()):
             self.results_ws.write(0, col_num, header, header_format)
 
         self.results_ws.freeze_panes(1,0)
 
+    def _resultsHeaders(self) -> List:
+        headers = ["Row Index","Name","Expected Value",
+                    "Operation","Actual Value","Check"]
+        if self.compactResults:
+            headers += ["Comment", "Row Link", "Expected Link", "Actual Link"]
+        return headers
+
+    def _resultsSheets(self) -> List:
+        return [ws for ws in self.workbook.worksheets 
+                if ws.title == "Results" or ws.title.startswith("Results-")]
+
+    def _checkResultsRollover(self) -> None:
+        self._materializeWorkbook()
+        if self.currentResultsRow <= self.resultsShardRows + 1:
+            return
+        
+        # Same header layout as the xlsxwriter built Results sheet
+        title = f"Results-{len(self._resultsSheets()) + 1}"
+        self.results_ws = self.workbook.create_sheet(title)
+        self.results_ws.append(self._resultsHeaders())
+        side = openpyxl.styles.Side(style="thin")
+        for cell in self.results_ws[1]:
+            cell.font = openpyxl.styles.Font(bold=True)
+            cell.alignment = openpyxl.styles.Alignment(horizontal="center", 
+                                                       vertical="center")
+            cell.border = openpyxl.styles.Border(left=side, right=side, 
+                                                 top=side, bottom=side)
+        
+        self.results_ws.freeze_panes = "A2"
+        self.currentResultsRow = 2
+
     def _openResultsWorkbook(self, output_file: str) -> None:
         self.workbook   = openpyxl.load_workbook(output_file)
         self.active_ws  = self.workbook.active
         self.results_ws = self.workbook['Results']       
+        self.currentResultsRow = self.results_ws.max_row + 1
+
+    def _materializeWorkbook(self) -> None:
+        if self._pendingTest is not None:
+            csv_files, output_file = self._pendingTest
+            self._pendingTest = None
+            self.initializeTest(csv_files=csv_files, output_file=output_file)
+
+    def _probeRecords(self, csvSheet: int, needle: Optional [bytes] = None):
+        # Yields (rowNum, record) with the same 1-based numbering as the
+        # AnalyzedData sheet, the header being row 1
+        csv_file = self._pendingTest[0][csvSheet - 1]
+        with open(csv_file, "rb") as file, \
+             mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            
+            if needle is not None and mm.find(needle) == -1:
+                return
+            
+            rowNum = 0
+            record = mm.readline()
+            if record.startswith(codecs.BOM_UTF8):
+                record = record[len(codecs.BOM_UTF8):]
+
+            while record:
+                # Quoted fields may span lines, keep reading until quotes balance
+                while record.count(b'"') % 2:
+                    line = mm.readline()
+                    if not line:
+                        break
+                    record += line
+                
+                record = record.rstrip(b"\r\n")
+                if record:
+                    rowNum += 1
+                    if needle is None or needle in record:
+                        yield rowNum, record
+                
+                record = mm.readline()
+
+    def _probeField(self, record: bytes, colNum: int, 
+                    convertNA: Optional [bool] = True) -> Optional [str]:
+        if b'"' in record:
+            fields = next(csv.reader([record.decode("utf-8")]))
+        else:
+            fields = record.decode("utf-8").split(",")
+        
+        if colNum < 1 or colNum > len(fields):
+            return None
+        
+        # pandas reads empty and NA-like fields as NaN, stored as empty cells
+        value = fields[colNum - 1]
+        if convertNA and value in _NA_VALUES:
+            return None
+        return value
+
+    def _probeRows(self, searchString: str, colNum: int, csvSheet: int, 
+                   startRow: Optional [int] = 1):
+        # Sheet cells hold str or None, None matches empty cells like the
+        # workbook path and other types never match
+        if searchString is None:
+            needle = None
+        elif isinstance(searchString, str):
+            needle = searchString.replace('"', '""').encode("utf-8")
+        else:
+            return
+        
+        for rowNum, record in self._probeRecords(csvSheet=csvSheet, needle=needle):
+            if rowNum >= startRow and \
+               self._probeField(record, colNum, convertNA=rowNum > 1) == searchString:
+                yield rowNum
 
     def _activateWorksheet(self, csvSheet: int) -> None:
+        self._materializeWorkbook()
         self.active_ws = self.workbook[f"AnalyzedData-{csvSheet}"]
     
     def getRowNumber(self, searchString: str, colNum: int, 
                      csvSheet: Optional [int] = 1, 
                      startRow: Optional [int] = None) -> int:
         
+        if self._pendingTest is not None:
+            return next(self._probeRows(searchString=searchString, 
+                                        colNum=colNum, 
+                                        csvSheet=csvSheet, 
+                                        startRow=startRow or 1), None)
+        
         self._activateWorksheet(csvSheet)
         startRow = startRow or self.active_ws.min_row
         iterator = self.active_ws.iter_rows(min_col=colNum, 
@@ -147,6 +513,13 @@ class CommonTest:
     def getColumnNumber(self, searchString: str, 
                         csvSheet: Optional [int] = 1) -> int:
         
+        if self._pendingTest is not None:
+            for rowNum, record in self._probeRecords(csvSheet=csvSheet):
+                header = next(csv.reader([record.decode("utf-8")]))
+                if searchString in header:
+                    return header.index(searchString) + 1
+                return None
+        
         self._activateWorksheet(csvSheet)
         iterator = self.active_ws.iter_cols(min_row=1, 
                                             max_row=1,
@@ -159,6 +532,11 @@ class CommonTest:
     def findAllRows(self, searchString: str, colNum: int, 
                     csvSheet: Optional [int] = 1) -> List:
         
+        if self._pendingTest is not None:
+            return list(self._probeRows(searchString=searchString, 
+                                        colNum=colNum, 
+                                        csvSheet=csvSheet))
+        
         allRows = []
         self._activateWorksheet(csvSheet)
         iterator = self.active_ws.iter_rows(min_col=colNum, 
@@ -194,45 +572,53 @@ class CommonTest:
                                           csvSheet=csvSheet))
 
         return list(union)
-    
-    def _returnStrCoordRC(self) -> str:
-        actVal = f'RC[{self._actValCol - self._checkCol}]'
-        expVal = f'RC[{self._expValCol - self._checkCol}]'
-        return actVal, expVal
-    
-    def _basicFormula(self, operator: str) -> str:
-        actVal, expVal = self._returnStrCoordRC()
-        return f"=IF({actVal} {operator} {expVal}, {self._passVal}, {self._failVal})"
 
-    def _commandTolerance(self, tol: float, cmmd: str) -> str:
-        actVal, expVal = self._returnStrCoordRC()
-        check1 = f"{actVal} <= {expVal} + {tol}"
-        check2 = f"{actVal} => {expVal} - {tol}"
-        formula = f"AND({check1}, {check2})"
-        
-        if cmmd in ("NTL"):
-            formula = f"NOT({formula})"
+    def buildSheetIndex(self, colName: str) -> Dict:
+        # Rows start at 1 like findAllRows, so the header row is indexed too
+        self._materializeWorkbook()
+        index = {}
+        for csvSheet in range(1, len(self.total_rows) + 1):
+            colNum = self.getColumnNumber(searchString=colName, csvSheet=csvSheet)
+            if colNum is None:
+                continue
+
+            iterator = self.active_ws.iter_rows(min_col=colNum, 
+                                                max_col=colNum,
+                                                values_only=True)
+            
+            for rowNum, rowVal in enumerate(iterator, start=self.active_ws.min_row):
+                index.setdefault(rowVal[0], []).append((csvSheet, rowNum))
 
-        return f"=IF({formula}, {self._passVal}, {self._failVal})"
+        self._sheetIndex[colName] = index
+        return index
 
-    def expectedValuesCheck(self, expectedValue: str, actualValue: str) -> None:
+    def findRowsAllSheets(self, searchString: str, colName: str) -> List:
+        if colName not in self._sheetIndex:
+            self.buildSheetIndex(colName=colName)
+
+        return list(self._sheetIndex[colName].get(searchString, []))
+    
+    def expectedValuesCheck(self, expectedValue: str, 
+                            actualValue: str) -> Tuple[str, Optional [str]]:
         expVal = None
-        stringSplit = expectedValue.trim().split(",", 1)
+        tolerance = None
+        stringSplit = expectedValue.strip().split(",", 1)
         commandStr = stringSplit[0]
         symbol, description = self._basicOperations.get(commandStr,
                                                         (None, None))
-        if commandStr in ("TL","NTL"):
-            parts = stringSplit[1].rsplit(",", 1)
-            expVal, tolerance = parts[0], parts[1]
-            val = self._commandWithtinTolerance(tol=tolerance, cmmd=commandStr)
+        if commandStr in ("TL","NTL") and len(stringSplit) > 1:
+            expVal, _, tolerance = stringSplit[1].rpartition(",")
             description = f"{description} {symbol} {tolerance}"
         
-        elif commandStr in self._basicOperations:
-            val = self._basicFormula(operator=symbol)
+        elif commandStr in self._basicOperations and len(stringSplit) > 1:
             expVal = stringSplit[1]
         
-        else:
-            val = None
+        # The check is evaluated here and stored as a value, so the Check
+        # column and the Summary totals always agree
+        val = self._evaluateCheck(commandStr=commandStr,
+                                  expVal=expVal,
+                                  actVal=actualValue,
+                                  tol=tolerance)
         
         # Writing Information to Results Worksheet
         self._setResultCellValue(value=expVal,
@@ -251,6 +637,52 @@ class CommonTest:
                                  resultRow=self.currentResultsRow,
                                  resultCol=self._checkCol)
 
+        return commandStr, val
+
+    def _evaluateCheck(self, commandStr: str, expVal: str, actVal: str, 
+                       tol: Optional [str] = None) -> Optional [str]:
+        # Finite numbers compare numerically, anything else compares as text.
+        # SEQ/NEQ always compare as text, blank values compare as ""
+        if commandStr not in self._basicOperations:
+            return None
+        
+        expVal = "" if expVal is None else str(expVal)
+        actVal = "" if actVal is None else str(actVal)
+        expNum, actNum = self._finiteNumber(expVal), self._finiteNumber(actVal)
+
+        if commandStr in ("TL", "NTL"):
+            tolNum = self._finiteNumber(tol)
+            if expNum is None or actNum is None or tolNum is None:
+                return self._failVal.value
+            passed = abs(actNum - expNum) <= tolNum
+            passed = not passed if commandStr == "NTL" else passed
+            return self._passVal.value if passed else self._failVal.value
+        
+        if commandStr not in ("SEQ", "NEQ") and expNum is not None and actNum is not None:
+            expVal, actVal = expNum, actNum
+
+        if commandStr in ("EQ", "SEQ"):
+            passed = actVal == expVal
+        elif commandStr in ("NE", "NEQ"):
+            passed = actVal != expVal
+        elif commandStr == "GE":
+            passed = actVal >= expVal
+        elif commandStr == "GT":
+            passed = actVal > expVal
+        elif commandStr == "LE":
+            passed = actVal <= expVal
+        else:
+            passed = actVal < expVal
+
+        return self._passVal.value if passed else self._failVal.value
+
+    def _finiteNumber(self, value: Optional [str]) -> Optional [float]:
+        try:
+            number = float(value)
+        except (TypeError, ValueError):
+            return None
+        return number if math.isfinite(number) else None
+
     def _increaseResultsRow(self) -> None:   
         self.currentResultsRow += 1
 
@@ -258,7 +690,8 @@ class CommonTest:
                      csvSheet: Optional [int] = 1) -> None:
         
         self._activateWorksheet(csvSheet=csvSheet)
-        self.active_ws(row=row, column=col, value=value).font = self._redFont
+        self.active_ws.cell(row=row, column=col, value=value).font = self._redFont
+        self._sheetIndex.clear()
 
     def getCellValue(self, row: int, col: int, csvSheet: Optional [int] = 1) -> str:
         self._activateWorksheet(csvSheet=csvSheet)
@@ -267,21 +700,47 @@ class CommonTest:
 
     def _setCellHyperlink(self, dataRow: int, dataCol: int, resultRow: int, 
                           resultCol: int, csvSheet: int) -> None:
-        cell = self.results_ws(row=resultRow, column=resultCol)
-        cell.hyperlink = f"#AnalyzedData-{csvSheet}!R{dataRow}C{dataCol}"
+        target = self._hyperlinkTarget(dataRow=dataRow, 
+                                       dataCol=dataCol, 
+                                       csvSheet=csvSheet)
+        if self.compactResults:
+            # Formulas have no cached value, so they get their own column
+            cell = self.results_ws.cell(row=resultRow, column=self._linkCols[resultCol])
+            cell.value = '=HYPERLINK("{}", "{}")'.format(target.replace('"', '""'), 
+                                                        target.lstrip("#").replace('"', '""'))
+        else:
+            # openpyxl fills an empty cell with the link target, keep it blank
+            cell = self.results_ws.cell(row=resultRow, column=resultCol)
+            value = cell.value
+            cell.hyperlink = target
+            cell.value = value
         cell.font = self._hyperLinkFont
+
+    def _hyperlinkTarget(self, dataRow: int, dataCol: int, csvSheet: int) -> str:
+        cellRef = f"{get_column_letter(dataCol)}{dataRow}"
+        return f"{self._linkFile}#'AnalyzedData-{csvSheet}'!{cellRef}"
     
     def _setResultCellValue(self, value: str, resultRow: int, resultCol: int) -> None:
-        self.results_ws(row=resultRow, column=resultCol, value=value)
+        self._materializeWorkbook()
+        # Assigned explicitly, cell(value=None) would keep an earlier value
+        self.results_ws.cell(row=resultRow, column=resultCol).value = value
 
     def _setCellComment(self, value: str, resultRow: int, resultCol: int) -> None:
-        self.results_ws(row=resultRow, column=resultCol).comment = value
+        if self.compactResults:
+            # Identical text is stored once in the shared strings table
+            self._setResultCellValue(value=value, 
+                                     resultRow=resultRow, 
+                                     resultCol=self._cmmtCol)
+        else:
+            self.results_ws.cell(row=resultRow, column=resultCol).comment = \
+                openpyxl.comments.Comment(value, "CommonTest")
 
     def addDataNameResults(self, titleStr: str, dataRow: int, 
                            dataCol: Optional [int] = 0, 
                            cmmt: Optional [str] = None, 
                            csvSheet: Optional [int] = 1) -> None:
         
+        self._checkResultsRollover()
         self._setResultCellValue(value=titleStr,
                                  resultRow=self.currentResultsRow, 
                                  resultCol=self._nameCol)
@@ -304,7 +763,9 @@ class CommonTest:
                                    csvSheet=csvSheet)
         
         if not cmmt is None:
-            self._setCellComment(value=openpyxl.comments.Comment(cmmt))
+            self._setCellComment(value=cmmt,
+                                 resultRow=self.currentResultsRow,
+                                 resultCol=self._nameCol)
             
     def writeResults(self, titleStr: str, dataRow: int, expectedValue: str, 
                      actualValue: str, dataCol: Optional[int] = 0, 
@@ -317,8 +778,129 @@ class CommonTest:
                                 cmmt=cmmt,
                                 csvSheet=csvSheet)
         
-        self.expectedValuesCheck(expectedValue=expectedValue,
-                                 actualValue=actualValue)
+        operation, result = self.expectedValuesCheck(expectedValue=expectedValue,
+                                                     actualValue=actualValue)
 
+        self._recordResult(titleStr=titleStr, 
+                           operation=operation, 
+                           csvSheet=csvSheet, 
+                           result=result)
         self._increaseResultsRow()
-        
\ No newline at end of file
+        
+    def reconcileSheets(self, keyCols: List[str], compareCols: List[str],
+                        leftSheet: Optional [int] = 1, 
+                        rightSheet: Optional [int] = 2,
+                        titleStr: Optional [str] = "Reconcile") -> Dict:
+        
+        compareCols = [colName for colName in compareCols if colName not in keyCols]
+        left, leftCols = self._sheetFrame(csvSheet=leftSheet, 
+                                          colNames=keyCols + compareCols)
+        right, rightCols = self._sheetFrame(csvSheet=rightSheet, 
+                                            colNames=keyCols + compareCols)
+        
+        # Blank keys never match, those rows are reported as missing/extra
+        leftBlank = left[keyCols].isna().any(axis=1).to_numpy()
+        rightBlank = right[keyCols].isna().any(axis=1).to_numpy()
+        leftBlankRows, rightBlankRows = left[leftBlank], right[rightBlank]
+        left, right = left[~leftBlank], right[~rightBlank]
+
+        # Repeated keys pair up by occurrence order instead of cross joining
+        left = left.assign(_occurrence=left.groupby(keyCols).cumcount())
+        right = right.assign(_occurrence=right.groupby(keyCols).cumcount())
+
+        # Hash join on the key columns, rows without a partner are kept
+        merged = left.merge(right, on=keyCols + ["_occurrence"], how="outer",
+                            suffixes=("_left", "_right"), indicator=True)
+        failVal = self._failVal.value
+        resultRows = []
+
+        isMissing = (merged["_merge"] == "left_only").to_numpy()
+        isExtra = (merged["_merge"] == "right_only").to_numpy()
+        missing = self._keyedRows(merged[isMissing], keyCols, "_row_left") + \
+                  self._keyedRows(leftBlankRows, keyCols, "_row")
+        extra = self._keyedRows(merged[isExtra], keyCols, "_row_right") + \
+                self._keyedRows(rightBlankRows, keyCols, "_row")
+
+        for leftRow, key in sorted(missing):
+            resultRows.append((
+                [leftRow, f"{titleStr}: Missing", key, "Missing", None, failVal],
+                [(self._rowCol, leftSheet, leftRow, leftCols[keyCols[0]])]))
+            self._recordResult(titleStr=titleStr, operation="Missing", 
+                               csvSheet=leftSheet, result=failVal)
+
+        for rightRow, key in sorted(extra):
+            resultRows.append((
+                [rightRow, f"{titleStr}: Extra", None, "Extra", key, failVal],
+                [(self._rowCol, rightSheet, rightRow, rightCols[keyCols[0]])]))
+            self._recordResult(titleStr=titleStr, operation="Extra", 
+                               csvSheet=rightSheet, result=failVal)
+
+        both = merged[(merged["_merge"] == "both").to_numpy()]
+        mismatched = []
+        for colName in compareCols:
+            leftVals = both[f"{colName}_left"]
+            rightVals = both[f"{colName}_right"]
+            isDiff = (leftVals.fillna("") != rightVals.fillna("")).to_numpy()
+
+            for leftRow, rightRow, leftVal, rightVal in zip(both["_row_left"][isDiff],
+                                                            both["_row_right"][isDiff],
+                                                            leftVals[isDiff],
+                                                            rightVals[isDiff]):
+                leftRow, rightRow = int(leftRow), int(rightRow)
+                mismatched.append((leftRow, rightRow, colName))
+                resultRows.append((
+                    [leftRow, f"{titleStr}: {colName}", leftVal, 
+                     self._basicOperations["EQ"][1], rightVal, failVal],
+                    [(self._rowCol, leftSheet, leftRow, 1),
+                     (self._expValCol, leftSheet, leftRow, leftCols[colName]),
+                     (self._actValCol, rightSheet, rightRow, rightCols[colName])]))
+                self._recordResult(titleStr=titleStr, operation="EQ", 
+                                   csvSheet=leftSheet, result=failVal)
+
+        self._writeResultRows(resultRows)
+
+        return {
+            "missing": sorted(row for row, _ in missing),
+            "extra": sorted(row for row, _ in extra),
+            "mismatched": sorted(mismatched)
+        }
+
+    def _keyedRows(self, frame: pd.DataFrame, keyCols: List[str], rowCol: str) -> List:
+        keys = frame[keyCols].fillna("").astype(str).agg(", ".join, axis=1)
+        return [(int(row), key) for row, key in zip(frame[rowCol], keys)]
+
+    def _sheetFrame(self, csvSheet: int, colNames: List[str]) -> Tuple[pd.DataFrame, Dict]:
+        self._materializeWorkbook()
+        colNums = {}
+        for colName in colNames:
+            colNum = self.getColumnNumber(searchString=colName, csvSheet=csvSheet)
+            if colNum is None:
+                raise ValueError(f"Column '{colName}' not found in AnalyzedData-{csvSheet}")
+            colNums[colName] = colNum
+
+        ws = self.workbook[f"AnalyzedData-{csvSheet}"]
+        frame = pd.DataFrame(ws.iter_rows(min_row=2, values_only=True),
+                             columns=range(1, ws.max_column + 1), dtype=object)
+        frame = frame[list(colNums.values())]
+        frame.columns = list(colNums)
+        frame["_row"] = range(2, len(frame) + 2)
+
+        return frame, colNums
+
+    def _writeResultRows(self, resultRows: List) -> None:
+        # Whole rows are appended, rows are (values, hyperlinks)
+        self._materializeWorkbook()
+        lastRow = self.resultsShardRows + 1
+        for values, links in resultRows:
+            if self.currentResultsRow > lastRow:
+                self._checkResultsRollover()
+
+            self.results_ws.append(values)
+            for resultCol, csvSheet, dataRow, dataCol in links:
+                self._setCellHyperlink(dataRow=dataRow,
+                                       dataCol=dataCol,
+                                       resultRow=self.currentResultsRow,
+                                       resultCol=resultCol,
+                                       csvSheet=csvSheet)
+
+            self.currentResultsRow += 1
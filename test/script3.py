@@ -2,7 +2,6 @@ import sys
 import importlib.util
 from pathlib import Path
 import os
-import pandas as pd
 
 def load_class_from_file(file_path, class_name):
 
@@ -50,11 +49,7 @@ def helperFunc():
         output_file= file_dir + output_file
     )
 
-    for index, paths in enumerate(csvTest):
-            df_csv = pd.read_csv(paths, dtype=str)
-            df_xlsx = pd.read_excel(file_dir + output_file,
-                                   sheet_name=f"AnalyzedData-{index+1}",
-                                   dtype=str)  
+    assert cls.verifyImport(file_dir + output_file), "Imported sheets do not match the CSVs"
 
 if __name__ == "__main__":
     helperFunc()
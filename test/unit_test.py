@@ -3,11 +3,15 @@ import importlib.util
 import sys
 import time
 import os
+import json
 import pandas as pd
+import openpyxl
 from pathlib import Path
 from concurrent.futures import ThreadPoolExecutor
 from multiprocessing import Pool
 import subprocess
+import multiprocessing
+from unittest import mock
 
 def load_class_from_file(file_path, class_name):
 
@@ -40,6 +44,7 @@ class TestInitialize(unittest.TestCase):
             "/../csv_data/realistic_data_10.csv"
         ]
         self.output_file = "/../results/realistic_data.xlsx"
+        self.summary_file = "/../results/realistic_data.summary.json"
         CommonTest = load_class_from_file(file_path=self.file_dir + "/../src/CommonTest.py",
                                           class_name="CommonTest")
         self.cls = CommonTest()
@@ -47,6 +52,8 @@ class TestInitialize(unittest.TestCase):
     def tearDown(self):
         if Path(self.file_dir + self.output_file).exists():
             Path(self.file_dir + self.output_file).unlink()
+        if Path(self.file_dir + self.summary_file).exists():
+            Path(self.file_dir + self.summary_file).unlink()
 
     def test_createFile(self):
         self.cls.initializeTest(
@@ -86,6 +93,20 @@ class TestInitialize(unittest.TestCase):
                                    dtype=str)
             
             self.assertEqual(df_csv.equals(df_xlsx), True)
+
+    def test_verifyImport(self):
+        self.cls.initializeTest(
+            csv_files=list(map(lambda x: self.file_dir + x, self.csv_files)),
+            output_file=self.file_dir + self.output_file
+        )
+
+        self.assertEqual(len(self.cls.fingerprints), len(self.csv_files))
+        self.assertEqual(self.cls.fingerprints[0][:2], (1000, 15))
+        self.assertEqual(self.cls.verifyImport(self.file_dir + self.output_file), True)
+
+        self.cls.workbook["AnalyzedData-3"].cell(row=10, column=2, value="Changed")
+        self.cls.endTest(self.file_dir + self.output_file)
+        self.assertEqual(self.cls.verifyImport(self.file_dir + self.output_file), False)
         
 class TestEnd(unittest.TestCase):
     def setUp(self):
@@ -103,6 +124,7 @@ class TestEnd(unittest.TestCase):
             "/../csv_data/realistic_data_10.csv"
         ]
         self.output_file = "/../results/realistic_data.xlsx"
+        self.summary_file = "/../results/realistic_data.summary.json"
         CommonTest = load_class_from_file(file_path=self.file_dir + "/../src/CommonTest.py",
                                           class_name="CommonTest")
         self.cls = CommonTest()
@@ -110,6 +132,8 @@ class TestEnd(unittest.TestCase):
     def tearDown(self):
         if Path(self.file_dir + self.output_file).exists():
             Path(self.file_dir + self.output_file).unlink()
+        if Path(self.file_dir + self.summary_file).exists():
+            Path(self.file_dir + self.summary_file).unlink()
 
     def test_saveFile(self):
         self.cls.initializeTest(
@@ -140,6 +164,7 @@ class TestGetCellInfo(unittest.TestCase):
             "/../csv_data/realistic_data_10.csv"
         ]
         self.output_file = "/../results/realistic_data.xlsx"
+        self.summary_file = "/../results/realistic_data.summary.json"
         CommonTest = load_class_from_file(file_path=self.file_dir + "/../src/CommonTest.py",
                                           class_name="CommonTest")
         self.cls = CommonTest()
@@ -152,6 +177,8 @@ class TestGetCellInfo(unittest.TestCase):
     def tearDown(self):
         if Path(self.file_dir + self.output_file).exists():
             Path(self.file_dir + self.output_file).unlink()
+        if Path(self.file_dir + self.summary_file).exists():
+            Path(self.file_dir + self.summary_file).unlink()
 
     def test_getRowNum(self):
         self.assertEqual(self.cls.getRowNumber("jennifer39@yahoo.com", 3), 503)
@@ -203,12 +230,95 @@ class TestGetCellInfo(unittest.TestCase):
         listRows = self.cls.findRowsUnion({1:"dfsjdf",2:"sdkfmdskf"},1)
         self.assertEqual(len(listRows), len(rowsName) + len(rowsState))
 
+    def test_findRowsAllSheets(self):
+        expected = []
+        for csvSheet in range(1, len(self.csv_files) + 1):
+            colNum = self.cls.getColumnNumber("State", csvSheet)
+            expected += [(csvSheet, row) for row in self.cls.findAllRows("Florida", colNum, csvSheet)]
+
+        self.assertEqual(self.cls.findRowsAllSheets("Florida", "State"), expected)
+        self.assertEqual(self.cls.findRowsAllSheets("Email", "Email"), 
+                         [(csvSheet, 1) for csvSheet in range(1, len(self.csv_files) + 1)])
+        self.assertEqual(self.cls.findRowsAllSheets("Email", "Email")[:1], 
+                         [(1, row) for row in self.cls.findAllRows("Email", 3)])
+        self.assertEqual(self.cls.findRowsAllSheets("jennifer39@yahoo.com", "Email"), [(1, 503), (3, 815)])
+        self.assertEqual(self.cls.findRowsAllSheets("Hello World", "State"), [])
+        self.assertEqual(self.cls.findRowsAllSheets("Florida", "Testing"), [])
+
+        self.cls.buildSheetIndex("State")
+        self.cls.setCellValue(expected[0][1], self.cls.getColumnNumber("State", expected[0][0]), 
+                              "Texas", expected[0][0])
+        self.assertEqual(self.cls.findRowsAllSheets("Florida", "State"), expected[1:])
+
     def test_getCellValue(self):
         self.assertEqual(self.cls.getCellValue(2,1), "Jessica")
         self.assertEqual(self.cls.getCellValue(500,1, 10), "Anthony")
         self.assertEqual(self.cls.getCellValue(5,4), "(170)522-9895")
         self.assertEqual(self.cls.getCellValue(10000,4, 10), None)
 
+class TestProbe(unittest.TestCase):
+    def setUp(self):
+        self.file_dir = str(Path(__file__).resolve().parent)
+        self.csv_files = [
+            "/../csv_data/realistic_data_1.csv",
+            "/../csv_data/realistic_data_2.csv",
+            "/../csv_data/realistic_data_3.csv",
+            "/../csv_data/realistic_data_4.csv",
+            "/../csv_data/realistic_data_5.csv",
+            "/../csv_data/realistic_data_6.csv",
+            "/../csv_data/realistic_data_7.csv",
+            "/../csv_data/realistic_data_8.csv",
+            "/../csv_data/realistic_data_9.csv",
+            "/../csv_data/realistic_data_10.csv"
+        ]
+        self.output_file = "/../results/realistic_data.xlsx"
+        CommonTest = load_class_from_file(file_path=self.file_dir + "/../src/CommonTest.py",
+                                          class_name="CommonTest")
+        self.cls = CommonTest()
+
+        self.cls.initializeTest(
+            csv_files=list(map(lambda x: self.file_dir + x, self.csv_files)),
+            output_file=self.file_dir + self.output_file,
+            probe=True
+        )
+
+    def tearDown(self):
+        if Path(self.file_dir + self.output_file).exists():
+            Path(self.file_dir + self.output_file).unlink()
+
+    def test_probeLookups(self):
+        self.assertEqual(self.cls.getRowNumber("jennifer39@yahoo.com", 3), 503)
+        self.assertEqual(self.cls.getRowNumber("Ruth", 1), 14)
+        self.assertEqual(self.cls.getRowNumber("6477", 14, 5), 1001)
+        self.assertEqual(self.cls.getRowNumber(6477, 14, 5), None)
+        self.assertEqual(self.cls.getColumnNumber("CreditCard"), 13)
+        self.assertEqual(self.cls.getColumnNumber("Testing", 10), None)
+        self.assertEqual(len(self.cls.findAllRows("David", 1, 1)), 16)
+        self.assertEqual(len(self.cls.findAllRows("Missouri", 7, 10)), 27)
+        self.assertEqual(self.cls.findRowsIntersect({1: "David", 7: "Florida"}, 10), [29])
+
+        # Quoted fields with embedded commas
+        self.assertEqual(self.cls.getRowNumber("8597 Mccarthy Extensions, Deborahmouth, NC 24021", 5), 2)
+        self.assertEqual(self.cls.getRowNumber("Smith, Martin and Rogers", 10), 3)
+        self.assertEqual(self.cls.getRowNumber("Deborahmouth", 5), None)
+
+        self.assertEqual(self.cls.findAllRows(None, 16, 1), list(range(1, 1002)))
+        self.assertEqual(self.cls.getRowNumber(None, 1, 1), None)
+
+        self.assertEqual(self.cls.workbook, None)
+        self.assertEqual(Path(self.file_dir + self.output_file).exists(), False)
+
+    def test_probeMatchesWorkbook(self):
+        probeRows = self.cls.findAllRows("Engineer, land", 11, 1)
+        probeRow = self.cls.getRowNumber("Engineer, land", 11, 1, 3)
+
+        self.assertEqual(self.cls.getCellValue(2, 1), "Jessica")
+        self.assertNotEqual(self.cls.workbook, None)
+        self.assertEqual(Path(self.file_dir + self.output_file).exists(), True)
+        self.assertEqual(self.cls.findAllRows("Engineer, land", 11, 1), probeRows)
+        self.assertEqual(self.cls.getRowNumber("Engineer, land", 11, 1, 3), probeRow)
+        self.assertEqual(self.cls.findAllRows(None, 16, 1), list(range(1, 1002)))
+
 class TestExpectedValuesCheck(unittest.TestCase):
     pass
 
@@ -219,7 +329,325 @@ class TestAddDataNameResults(unittest.TestCase):
     pass
 
 class TestWriteResults(unittest.TestCase):
-    pass
+    def setUp(self):
+        self.file_dir = str(Path(__file__).resolve().parent)
+        self.csv_files = [
+            "/../csv_data/realistic_data_1.csv",
+            "/../csv_data/realistic_data_2.csv"
+        ]
+        self.output_file = "/../results/realistic_data.xlsx"
+        self.summary_file = "/../results/realistic_data.summary.json"
+        CommonTest = load_class_from_file(file_path=self.file_dir + "/../src/CommonTest.py",
+                                          class_name="CommonTest")
+        self.cls = CommonTest()
+
+        self.cls.initializeTest(
+            csv_files=list(map(lambda x: self.file_dir + x, self.csv_files)),
+            output_file=self.file_dir + self.output_file
+        )
+
+    def tearDown(self):
+        if Path(self.file_dir + self.output_file).exists():
+            Path(self.file_dir + self.output_file).unlink()
+        if Path(self.file_dir + self.summary_file).exists():
+            Path(self.file_dir + self.summary_file).unlink()
+
+    def test_writeResults(self):
+        self.cls.writeResults("Name", 2, "EQ,Jessica", self.cls.getCellValue(2, 1), 1, "First row")
+        self.assertEqual(self.cls.currentResultsRow, 3)
+        self.assertEqual(self.cls.results_ws.cell(row=2, column=2).value, "Name")
+        self.assertEqual(self.cls.results_ws.cell(row=2, column=2).comment.text, "First row")
+        self.assertEqual(self.cls.results_ws.cell(row=2, column=3).value, "Jessica")
+        self.assertEqual(self.cls.results_ws.cell(row=2, column=5).value, "Jessica")
+        self.assertEqual(self.cls.results_ws.cell(row=2, column=1).hyperlink.target,
+                         "#'AnalyzedData-1'!A2")
+
+    def test_writeResultsBlankValue(self):
+        self.cls.writeResults("Salary", 2, "EQ,1", None, 14)
+        self.cls.endTest(self.file_dir + self.output_file)
+
+        # openpyxl refills linked empty cells on load, so values come from pandas
+        df_results = pd.read_excel(self.file_dir + self.output_file, sheet_name="Results")
+        self.assertEqual(pd.isna(df_results.loc[0, "Actual Value"]), True)
+        self.assertEqual(df_results.loc[0, "Row Index"], 2)
+
+        results_ws = openpyxl.load_workbook(self.file_dir + self.output_file)["Results"]
+        self.assertEqual(results_ws.cell(row=2, column=5).hyperlink.target, "#'AnalyzedData-1'!N2")
+
+    def test_checkColumn(self):
+        self.cls.writeResults("Name", 2, "EQ,jessica", "Jessica", 1)
+        self.cls.writeResults("Salary", 2, "GT,100000", "97268", 14)
+        self.cls.writeResults("Salary", 3, "TL,5,abc", "5", 14)
+        self.cls.writeResults("Salary", 4, "TL,52660,10", "52666", 14)
+
+        self.assertEqual(self.cls.currentResultsRow, 6)
+        checks = [self.cls.results_ws.cell(row=row, column=6).value for row in range(2, 6)]
+        self.assertEqual(checks, ["FAIL", "FAIL", "FAIL", "PASS"])
+        self.assertEqual(self.cls.results_ws.cell(row=4, column=4).value, "Within +/- abc")
+        self.assertEqual(self.cls.getResultSummary()["total"], 
+                         {"PASS": checks.count("PASS"), "FAIL": checks.count("FAIL"), "Total": 4})
+
+    def test_checkEdgeCases(self):
+        checks = [
+            ("EQ,", None, "PASS"),
+            ("EQ", "None", "FAIL"),
+            ("EQ,nan", "nan", "PASS"),
+            ("GT,inf", "5", "FAIL"),
+            ("TL,nan,1", "nan", "FAIL"),
+            ("EQ,01", "1", "PASS"),
+            ("SEQ,01", "1", "FAIL"),
+            ("SEQ,abc", "abc", "PASS"),
+            ("NEQ,01", "1", "PASS")
+        ]
+        for row, (expectedValue, actualValue, _) in enumerate(checks, start=2):
+            self.cls.writeResults("Edge", row, expectedValue, actualValue)
+
+        self.assertEqual([self.cls.results_ws.cell(row=row, column=6).value 
+                          for row in range(2, len(checks) + 2)],
+                         [check for _, _, check in checks])
+        self.assertEqual(self.cls.results_ws.cell(row=8, column=4).value, "Equals")
+        self.assertEqual(self.cls.results_ws.cell(row=10, column=4).value, "Not Equals")
+        self.assertEqual(self.cls.getResultSummary()["total"]["Total"], len(checks))
+        self.assertEqual(self.cls.getResultSummary()["operation"]["SEQ"], 
+                         {"PASS": 1, "FAIL": 1, "Total": 2})
+
+    def test_compactResults(self):
+        CommonTest = load_class_from_file(file_path=self.file_dir + "/../src/CommonTest.py",
+                                          class_name="CommonTest")
+        self.cls = CommonTest(compactResults=True)
+        self.cls.initializeTest(
+            csv_files=list(map(lambda x: self.file_dir + x, self.csv_files)),
+            output_file=self.file_dir + self.output_file
+        )
+
+        for row in range(2, 12):
+            self.cls.writeResults("Salary", row, "GT,0", self.cls.getCellValue(row, 14), 14, 
+                                  'Checked "manually"')
+        self.cls.endTest(self.file_dir + self.output_file)
+
+        results_ws = self.cls.workbook["Results"]
+        self.assertEqual([cell.value for cell in results_ws[1]][6:],
+                         ["Comment", "Row Link", "Expected Link", "Actual Link"])
+        self.assertEqual(results_ws.cell(row=2, column=7).value, 'Checked "manually"')
+        self.assertEqual(results_ws.cell(row=2, column=8).value,
+                         "=HYPERLINK(\"#'AnalyzedData-1'!A2\", \"'AnalyzedData-1'!A2\")")
+        self.assertEqual(results_ws.cell(row=2, column=10).value,
+                         "=HYPERLINK(\"#'AnalyzedData-1'!N2\", \"'AnalyzedData-1'!N2\")")
+        self.assertEqual(any(cell.comment or cell.hyperlink 
+                             for row in results_ws.iter_rows() for cell in row), False)
+        self.assertEqual(self.cls.getResultSummary()["total"]["PASS"], 10)
+
+        # Data cells keep plain values for readers that do not evaluate formulas
+        df_results = pd.read_excel(self.file_dir + self.output_file, 
+                                   sheet_name="Results", dtype=str)
+        self.assertEqual(df_results["Row Index"].tolist(), [str(row) for row in range(2, 12)])
+        self.assertEqual(df_results.loc[0, "Actual Value"], "97268")
+        self.assertEqual(df_results["Check"].tolist(), ["PASS"] * 10)
+
+    def test_resultSummary(self):
+        self.cls.writeResults("Name", 2, "EQ,Jessica", "Jessica", 1)
+        self.cls.writeResults("Salary", 2, "GT,100000", "97268", 14)
+        self.cls.writeResults("Salary", 3, "TL,52660,10", "52666", 14, csvSheet=2)
+        self.cls.writeResults("Salary", 3, "NTL,52660,10", "52666", 14, csvSheet=2)
+
+        summary = self.cls.getResultSummary()
+        self.assertEqual(summary["total"], {"PASS": 2, "FAIL": 2, "Total": 4})
+        self.assertEqual(summary["titleStr"]["Salary"], {"PASS": 1, "FAIL": 2, "Total": 3})
+        self.assertEqual(summary["operation"]["TL"], {"PASS": 1, "FAIL": 0, "Total": 1})
+        self.assertEqual(summary["csvSheet"]["1"], {"PASS": 1, "FAIL": 1, "Total": 2})
+
+        self.cls.endTest(self.file_dir + self.output_file)
+        with open(self.file_dir + self.summary_file) as summary_file:
+            self.assertEqual(json.load(summary_file), summary)
+        
+        summary_ws = self.cls.workbook["Summary"]
+        self.assertEqual(summary_ws.cell(row=2, column=1).value, "Total")
+        self.assertEqual(summary_ws.cell(row=2, column=5).value, 4)
+        self.assertEqual(any(isinstance(cell, str) and cell.startswith("=") 
+                             for row in summary_ws.values for cell in row), False)
+
+class TestReconcileSheets(unittest.TestCase):
+    def setUp(self):
+        self.file_dir = str(Path(__file__).resolve().parent)
+        self.csv_files = [
+            "/../csv_data/realistic_data_1.csv",
+            "/../csv_data/realistic_data_1.csv"
+        ]
+        self.output_file = "/../results/realistic_data.xlsx"
+        self.summary_file = "/../results/realistic_data.summary.json"
+        CommonTest = load_class_from_file(file_path=self.file_dir + "/../src/CommonTest.py",
+                                          class_name="CommonTest")
+        self.cls = CommonTest()
+
+        self.cls.initializeTest(
+            csv_files=list(map(lambda x: self.file_dir + x, self.csv_files)),
+            output_file=self.file_dir + self.output_file
+        )
+
+    def tearDown(self):
+        if Path(self.file_dir + self.output_file).exists():
+            Path(self.file_dir + self.output_file).unlink()
+        if Path(self.file_dir + self.summary_file).exists():
+            Path(self.file_dir + self.summary_file).unlink()
+
+    def test_reconcileMatch(self):
+        report = self.cls.reconcileSheets(["Email"], ["Salary", "CreditCard"])
+        self.assertEqual(report, {"missing": [], "extra": [], "mismatched": []})
+        self.assertEqual(self.cls.results_ws.max_row, 1)
+
+    def test_reconcileDifferences(self):
+        ws = self.cls.workbook["AnalyzedData-2"]
+        ws.cell(row=5, column=14, value="1")
+        ws.cell(row=7, column=3, value="nobody@example.com")
+
+        report = self.cls.reconcileSheets(["Email"], ["Salary", "CreditCard"])
+        self.assertEqual(report["missing"], [7])
+        self.assertEqual(report["extra"], [7])
+        self.assertEqual(report["mismatched"], [(5, 5, "Salary")])
+
+        self.assertEqual(self.cls.results_ws.max_row, 4)
+        self.assertEqual(self.cls.currentResultsRow, 5)
+        self.assertEqual(self.cls.results_ws.cell(row=4, column=2).value, "Reconcile: Salary")
+        self.assertEqual(self.cls.results_ws.cell(row=4, column=3).hyperlink.target,
+                         "#'AnalyzedData-1'!N5")
+        self.assertEqual(self.cls.results_ws.cell(row=4, column=5).hyperlink.target,
+                         "#'AnalyzedData-2'!N5")
+
+        self.cls.endTest(self.file_dir + self.output_file)
+        self.assertEqual(Path(self.file_dir + self.output_file).exists(), True)
+
+    def test_reconcileDuplicateKeys(self):
+        for sheet in ("AnalyzedData-1", "AnalyzedData-2"):
+            self.cls.workbook[sheet].cell(row=3, column=3, value="lindavega@johnson.info")
+
+        report = self.cls.reconcileSheets(["Email"], ["Salary"])
+        self.assertEqual(report, {"missing": [], "extra": [], "mismatched": []})
+
+        self.cls.workbook["AnalyzedData-2"].cell(row=3, column=14, value="1")
+        report = self.cls.reconcileSheets(["Email"], ["Salary"])
+        self.assertEqual(report["mismatched"], [(3, 3, "Salary")])
+
+    def test_reconcileBlankKeys(self):
+        for sheet in ("AnalyzedData-1", "AnalyzedData-2"):
+            self.cls.workbook[sheet].cell(row=10, column=3).value = None
+            self.cls.workbook[sheet].cell(row=11, column=3).value = None
+
+        report = self.cls.reconcileSheets(["Email"], ["Salary"])
+        self.assertEqual(report, {"missing": [10, 11], "extra": [10, 11], "mismatched": []})
+        self.assertEqual(self.cls.results_ws.cell(row=2, column=4).value, "Missing")
+        self.assertEqual(self.cls.results_ws.cell(row=4, column=4).value, "Extra")
+
+    def test_reconcileBlankValues(self):
+        self.cls.workbook["AnalyzedData-1"].cell(row=3, column=14).value = None
+
+        report = self.cls.reconcileSheets(["Email"], ["Salary"])
+        self.assertEqual(report["mismatched"], [(3, 3, "Salary")])
+        self.assertEqual(self.cls.results_ws.cell(row=2, column=3).value, None)
+        self.assertEqual(self.cls.results_ws.cell(row=2, column=3).hyperlink.target,
+                         "#'AnalyzedData-1'!N3")
+        self.assertEqual(self.cls.results_ws.cell(row=2, column=5).value, "52666")
+
+    def test_reconcileMissingColumn(self):
+        with self.assertRaises(ValueError):
+            self.cls.reconcileSheets(["Email"], ["Testing"])
+
+class TestShardResults(unittest.TestCase):
+    def setUp(self):
+        self.file_dir = str(Path(__file__).resolve().parent)
+        self.csv_files = [
+            "/../csv_data/realistic_data_1.csv"
+        ]
+        self.output_file = "/../results/realistic_data_shard.xlsx"
+        self.CommonTest = load_class_from_file(file_path=self.file_dir + "/../src/CommonTest.py",
+                                               class_name="CommonTest")
+
+    def tearDown(self):
+        for path in Path(self.file_dir + "/../results/").glob("realistic_data_shard*"):
+            path.unlink()
+
+    def writeResults(self, cls, count):
+        cls.initializeTest(
+            csv_files=list(map(lambda x: self.file_dir + x, self.csv_files)),
+            output_file=self.file_dir + self.output_file
+        )
+
+        for row in range(2, count + 2):
+            cls.writeResults("Salary", row, "GT,0", cls.getCellValue(row, 14), 14, "Shard")
+
+    def test_shardSheets(self):
+        cls = self.CommonTest(resultsShardRows=5)
+        self.writeResults(cls, 12)
+
+        self.assertEqual([ws.title for ws in cls._resultsSheets()], 
+                         ["Results", "Results-2", "Results-3"])
+        self.assertEqual([ws.max_row for ws in cls._resultsSheets()], [6, 6, 3])
+        self.assertEqual(cls.workbook["Results-2"].cell(row=1, column=1).value, "Row Index")
+        self.assertEqual(cls.workbook["Results-2"].cell(row=2, column=1).value, 7)
+        self.assertEqual(cls.getResultSummary()["total"]["Total"], 12)
+
+    def test_shardRowsValidation(self):
+        for rows in (0, -1):
+            with self.assertRaises(ValueError):
+                self.CommonTest(resultsShardRows=rows)
+
+        self.assertEqual(self.CommonTest().resultsShardRows, 1048575)
+        self.assertEqual(self.CommonTest(resultsShardRows=2000000).resultsShardRows, 1048575)
+
+    def test_shardFiles(self):
+        cls = self.CommonTest(resultsShardRows=5, shardFiles=True)
+        self.writeResults(cls, 12)
+        cls.endTest(self.file_dir + self.output_file)
+
+        results_dir = self.file_dir + "/../results/"
+        workbook = openpyxl.load_workbook(results_dir + "realistic_data_shard.xlsx")
+        self.assertEqual(workbook.sheetnames, ["AnalyzedData-1", "Summary"])
+
+        shard_ws = openpyxl.load_workbook(results_dir + "realistic_data_shard_Results-2.xlsx").active
+        self.assertEqual(shard_ws.max_row, 6)
+        self.assertEqual(shard_ws.cell(row=2, column=2).value, "Salary")
+        self.assertEqual(shard_ws.cell(row=2, column=2).comment.text, "Shard")
+        self.assertEqual(shard_ws.cell(row=2, column=5).hyperlink.target, "realistic_data_shard.xlsx")
+        self.assertEqual(shard_ws.cell(row=2, column=5).hyperlink.location, "'AnalyzedData-1'!N7")
+
+        index_ws = openpyxl.load_workbook(results_dir + "realistic_data_shard_Results.xlsx").active
+        self.assertEqual([row[:2] for row in index_ws.iter_rows(min_row=2, values_only=True)],
+                         [(1, 5), (2, 5), (3, 2), ("Total", 12)])
+        self.assertEqual(index_ws.cell(row=4, column=3).hyperlink.target, 
+                         "realistic_data_shard_Results-3.xlsx")
+
+    def test_shardFilesSpawn(self):
+        start_method = multiprocessing.get_start_method()
+        multiprocessing.set_start_method("spawn", force=True)
+        try:
+            cls = self.CommonTest(resultsShardRows=5, shardFiles=True)
+            self.writeResults(cls, 12)
+
+            # Disable the in-process fallback so a broken pool fails the test
+            module = sys.modules[self.CommonTest.__module__]
+            with mock.patch.object(module, "BrokenProcessPool", type("Unused", (Exception,), {})):
+                cls.endTest(self.file_dir + self.output_file)
+        finally:
+            multiprocessing.set_start_method(start_method, force=True)
+
+        results_dir = self.file_dir + "/../results/"
+        for index in range(1, 4):
+            self.assertEqual(Path(results_dir + f"realistic_data_shard_Results-{index}.xlsx").exists(), True)
+        self.assertEqual(Path(results_dir + "realistic_data_shard_Results.xlsx").exists(), True)
+
+    def test_shardFilesBrokenPool(self):
+        module = sys.modules[self.CommonTest.__module__]
+        cls = self.CommonTest(resultsShardRows=5, shardFiles=True)
+        self.writeResults(cls, 12)
+
+        with mock.patch.object(module, "ProcessPoolExecutor", 
+                               side_effect=module.BrokenProcessPool):
+            cls.endTest(self.file_dir + self.output_file)
+
+        results_dir = self.file_dir + "/../results/"
+        shard_ws = openpyxl.load_workbook(results_dir + "realistic_data_shard_Results-3.xlsx").active
+        self.assertEqual(shard_ws.max_row, 3)
+        self.assertEqual(openpyxl.load_workbook(results_dir + "realistic_data_shard.xlsx").sheetnames,
+                         ["AnalyzedData-1", "Summary"])
 
 class TestParellelProcess(unittest.TestCase):
     
@@ -260,13 +688,7 @@ class TestParellelProcess(unittest.TestCase):
             output_file=self.file_dir + output_file
         )
         
-        for index, paths in enumerate(csvTest):
-            df_csv = pd.read_csv(paths, dtype=str)
-            df_xlsx = pd.read_excel(self.file_dir + output_file,
-                                   sheet_name=f"AnalyzedData-{index+1}",
-                                   dtype=str)
-            
-            self.assertEqual(df_csv.equals(df_xlsx), True)
+        self.assertEqual(cls.verifyImport(self.file_dir + output_file), True)
        
     def sequentialFunc(self, num_files=3):
         start_seq = time.time()